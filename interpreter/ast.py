@@ -4,19 +4,27 @@ from interpreter import Token
 
 
 class Node:  # AST 节点，分为语句和表达式
+    __slots__ = ()
+
     def __repr__(self):
-        return f"{self.__class__.__name__}({', '.join(f'{attr[0]}={repr(attr[1])}' for attr in self.__dict__.items())})"
+        slots = (name for cls in reversed(type(self).__mro__) for name in cls.__dict__.get("__slots__", ()))
+        attrs = (name for name in slots if not name.startswith("_"))  # skip private caches
+        return f"{self.__class__.__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in attrs)})"
 
 
-class Statement(Node): ...  # 语句
+class Statement(Node):  # 语句
+    __slots__ = ()
 
 
-class Expression(Node): ...  # 表达式
+class Expression(Node):  # 表达式
+    __slots__ = ()
 
 
 class Program:  # 程序由语句组成
+    __slots__ = ("stmts",)
+
     def __init__(self, stmts: Optional[list[Statement]] = None):
-        self.stmts = stmts or []
+        self.stmts = [] if stmts is None else stmts
 
     def append(self, stmt: Statement):
         self.stmts.append(stmt)
@@ -25,7 +33,7 @@ class Program:  # 程序由语句组成
         return len(self.stmts)
 
     def __iter__(self):
-        yield from self.stmts
+        return iter(self.stmts)
 
     def __repr__(self):
         return f"Program(stmts={self.stmts!r})"
@@ -35,6 +43,8 @@ class Program:  # 程序由语句组成
 
 
 class ExprStatement(Statement):  # 表达式语句: `<表达式>;`
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Expression):
         self.expr = expr
 
@@ -43,6 +53,8 @@ class ExprStatement(Statement):  # 表达式语句: `<表达式>;`
 
 
 class IdenExpression(Expression):  # 标识符表达式
+    __slots__ = ("iden",)
+
     def __init__(self, iden: str):
         self.iden = iden
 
@@ -54,6 +66,8 @@ LiteralType = TypeVar("LiteralType", int, float, bool, str)
 
 
 class LiteralExpression(Expression, Generic[LiteralType]):
+    __slots__ = ("literal",)
+
     def __init__(self, literal: LiteralType):
         self.literal = literal
 
@@ -61,54 +75,79 @@ class LiteralExpression(Expression, Generic[LiteralType]):
         return str(self.literal)
 
 
-class IntLiteralExpression(LiteralExpression[int]): ...
+class IntLiteralExpression(LiteralExpression[int]):
+    __slots__ = ()
 
 
-class FloatLiteralExpression(LiteralExpression[float]): ...
+class FloatLiteralExpression(LiteralExpression[float]):
+    __slots__ = ()
 
 
-class BoolLiteralExpression(LiteralExpression[bool]): ...
+class BoolLiteralExpression(LiteralExpression[bool]):
+    __slots__ = ()
 
 
 class StrLiteralExpression(LiteralExpression[str]):
+    __slots__ = ()
+
     def __str__(self):
         return f'"{self.literal}"'
 
 
 class UnaryOperatorExpression(Expression):
+    __slots__ = ("operator", "right", "_str")
+
     def __init__(self, operator: Token, right: Expression):
         self.operator = operator
         self.right = right
+        self._str = None  # nodes are immutable after parsing, `__str__` is rendered once
 
     def __str__(self):
-        return f"({self.operator.text}{str(self.right)})"
+        if self._str is None:
+            self._str = f"({self.operator.text}{str(self.right)})"
+        return self._str
 
 
 class BinaryOperatorExpression(Expression):
+    __slots__ = ("left", "operator", "right", "_str")
+
     def __init__(self, left: Expression, operator: Token, right: Expression):
         self.left = left
         self.operator = operator
         self.right = right
+        self._str = None
 
     def __str__(self):
-        return f"({str(self.left)} {self.operator.text} {str(self.right)})"
+        if self._str is None:
+            self._str = f"({str(self.left)} {self.operator.text} {str(self.right)})"
+        return self._str
 
 
 class AssignExpression(Expression):
+    __slots__ = ("name", "operator", "right", "_str")
+
     def __init__(self, name: str, operator: Token, right: Expression):
         self.name = name
         self.operator = operator
         self.right = right
+        self._str = None
 
     def __str__(self):
-        return f"({self.name} {self.operator.text} {str(self.right)})"
+        if self._str is None:
+            self._str = f"({self.name} {self.operator.text} {str(self.right)})"
+        return self._str
 
 
 class ConditionalExpression(Expression):
+    __slots__ = ("condition", "consequence", "alternative", "_str")
+
     def __init__(self, condition: Expression, consequence: Expression, alternative: Expression):
         self.condition = condition
         self.consequence = consequence
         self.alternative = alternative
+        self._str = None
 
     def __str__(self):
-        return f"({str(self.condition)} ? {str(self.consequence)} : {str(self.alternative)})"
+        if self._str is None:
+            self._str = f"({str(self.condition)} ? {str(self.consequence)} : {str(self.alternative)})"
+        return self._str
@@ -1,4 +1,6 @@
-from string import ascii_letters
+import re
+import sys
+from typing import NoReturn, Optional
 
 from interpreter import BUILTIN_KEYWORDS, BUILTIN_SYMBOLS, Token, TokenType
 
@@ -6,130 +8,111 @@ from interpreter import BUILTIN_KEYWORDS, BUILTIN_SYMBOLS, Token, TokenType
 class LexerError(Exception): ...
 
 
+_WHITESPACE = " \t\r\n"
+
+# every match skips the run of whitespace in front of a token, `\Z` matches the trailing whitespace of the input
+_TOKEN_RE = re.compile(
+    r"[ \t\r\n]*(?:"  # 空白符
+    r'"(?P<STR>[^"]*)"'  # 字符串: "<字符序列>"
+    r"|(?P<HEX>0[xX][0-9a-fA-F]*)"  # 十六进制整数: 0x12AB
+    r"|(?P<FLOAT>[0-9]+(?:\.[0-9]*(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+)(?![0-9.eE]))"  # 浮点数: 0.1, 1e+7, 1e-7, 2.3e7
+    r"|(?P<INT>[0-9]+(?![0-9.eE]))"  # 整数: 42
+    r"|(?P<BADNUM>[0-9](?:[eE][+-]?|[0-9A-Za-z_.])*)"  # 非法数字: 1.2.3, 1e5e3, 1e, 1.5e+
+    r"|(?P<IDENT>[A-Za-z_][A-Za-z_0-9]*)"  # 标识符: _abc, abc, abc_1, abc123, ...
+    r"|(?P<SEMICOLON>;(?:[ \t\r\n]*;)*)"  # 连续的分号合并为一个, 空语句不会产生多余的 token
+    r"|(?P<SYMBOL>[=!<>+\-*/&|]=?|[,?:(){}\[\]])"  # 运算符: >, >=, ... ；分隔符: , ( ...
+    r"|\Z)"
+)
+
+
+# keyword/symbol/EOF tokens are immutable, so the lexer yields shared instances for them
+_SYMBOL_TOKENS = {sym: Token(tt) for sym, tt in BUILTIN_SYMBOLS.items()}
+_KEYWORD_TOKENS = {kw: Token(tt, kw) for kw, tt in BUILTIN_KEYWORDS.items()}
+_EOF_TOKEN = Token(TokenType.EOF)
+
+
+def _str_token(text: str) -> Token:
+    return Token(TokenType.STRING, text)
+
+
+def _hex_token(text: str) -> Token:
+    if len(text) <= 2:
+        raise LexerError(f"Invalid hex number: {text}")
+    return Token(TokenType.HEX, text)
+
+
+def _int_token(text: str) -> Token:
+    return Token(TokenType.INT, text)
+
+
+def _float_token(text: str) -> Token:
+    return Token(TokenType.FLOAT, text)
+
+
+def _bad_number(text: str) -> NoReturn:
+    raise LexerError(f"Invalid number: {text}")
+
+
+def _semicolon_token(text: str, _semicolon=_SYMBOL_TOKENS[";"]) -> Token:
+    return _semicolon
+
+
+def _iden_token(text: str, _keyword=_KEYWORD_TOKENS.get, _intern=sys.intern) -> Token:
+    keyword = _keyword(text)  # keyword texts are already shared by `_KEYWORD_TOKENS`
+    return keyword if keyword is not None else Token(TokenType.IDENTIFIER, _intern(text))
+
+
+_TOKEN_BUILDERS = {
+    "STR": _str_token,
+    "HEX": _hex_token,
+    "INT": _int_token,
+    "FLOAT": _float_token,
+    "BADNUM": _bad_number,
+    "IDENT": _iden_token,
+    "SEMICOLON": _semicolon_token,
+    "SYMBOL": _SYMBOL_TOKENS.__getitem__,
+}
+
+
 class Lexer:
     def __init__(self, input: str):
         self.input = input
-
-    def __iter__(self):
-        position = 0  # pointer to the position of the input string
-        while position < len(self.input):
-            ch = self.input[position]
-            match ch:
-                case " " | "\r" | "\n" | "\t":  # skip whitespace
-                    ...
-                case '"':
-                    literal = _read_string(self.input, position)
-                    position += len(literal) + 1
-                    yield Token(TokenType.STRING, literal)
-                case "=" | "!" | "<" | ">" | "+" | "-" | "*" | "/" | "&" | "|":
-                    operator = _read_operator(self.input, position)
-                    position += len(operator) - 1
-                    yield Token(BUILTIN_SYMBOLS[operator])
-                case "," | ";" | "?" | ":" | "(" | ")" | "{" | "}" | "[" | "]":
-                    yield Token(BUILTIN_SYMBOLS[ch])
-                case _:
-                    if _is_letter(ch):  # identifier
-                        iden = _read_iden(self.input, position)
-                        position += len(iden) - 1
-                        yield Token(BUILTIN_KEYWORDS.get(iden, TokenType.IDENTIFIER), iden)
-                    elif _is_digit(ch):  # numbers
-                        number = _read_number(self.input, position)
-                        position += len(number) - 1
-                        yield Token(TokenType.NUMBER, number)
-                    else:
-                        raise LexerError(f"Unknown illegal characters: {ch}")
-            position += 1
-        yield Token(TokenType.EOF)
-
-
-def _read_string(seq: str, start_position: int) -> str:  # "<字符序列>"
-    end_position = start_position + 1
-    while end_position < len(seq) and seq[end_position] != '"':
-        end_position += 1
-    if end_position == len(seq):
+        self.position = 0  # position of the next token, past the end of input once EOF has been returned
+
+    def __iter__(self):  # every iterator keeps its own position, `next_token`/`reset` are left untouched
+        seq, position = self.input, 0
+        match, builders = _TOKEN_RE.match, _TOKEN_BUILDERS
+        while True:
+            m = match(seq, position)
+            if m is None:  # characters at `position` can not be matched
+                _illegal(seq, position)
+            kind = m.lastgroup
+            if kind is None:  # `None` is the end of input
+                yield _EOF_TOKEN
+                return
+            position = m.end()
+            yield builders[kind](m.group(kind))
+
+    def reset(self):
+        self.position = 0
+
+    def next_token(self) -> Optional[Token]:  # pull one token on demand, `None` after EOF
+        seq, position = self.input, self.position
+        if position > len(seq):
+            return None
+        m = _TOKEN_RE.match(seq, position)
+        if m is None:  # characters at `position` can not be matched
+            _illegal(seq, position)
+        kind = m.lastgroup
+        if kind is None:  # `None` is the end of input
+            self.position = len(seq) + 1
+            return _EOF_TOKEN
+        self.position = m.end()
+        return _TOKEN_BUILDERS[kind](m.group(kind))
+
+
+def _illegal(seq: str, position: int) -> NoReturn:
+    ch = seq[position:].lstrip(_WHITESPACE)[0]  # the unmatched gap may start with whitespace
+    if ch == '"':
         raise LexerError("The string must be enclosed in double quotes.")
-    return seq[start_position + 1 : end_position]
-
-
-def _read_operator(seq: str, position: int) -> str:  # 运算符: >, >=, ...
-    if position >= len(seq) - 1:
-        return seq[position]
-    if seq[position + 1] == "=":
-        return seq[position : position + 2]
-    else:
-        return seq[position]
-
-
-def _read_iden(seq: str, start_position: int) -> str:  # 标识符: _abc, abc, abc_1, abc123, ...
-    end_position = start_position + 1
-    while end_position < len(seq):
-        ch = seq[end_position]
-        if _is_letter(ch) or _is_digit(ch):
-            end_position += 1
-        else:
-            break
-    return seq[start_position:end_position]
-
-
-def _read_number(seq: str, start_position: int) -> str:  # 整数: 42, 0x12AB ；浮点数: 0.1, 1e+7, 1e-7, 2.3e7
-    hex = __is_hex(seq, start_position)  # 十六进制
-    if hex:
-        end_position = start_position + 2
-        while end_position < len(seq) and seq[end_position] in "0123456789abcdefABCDEF":
-            end_position += 1
-        if end_position - start_position <= 2:
-            raise LexerError(f"Invalid hex number: {seq[start_position:end_position]}")
-        return seq[start_position:end_position]
-    else:
-        cnt_point = 0  # 小数点 <= 1
-        cnt_e = 0  # 1e-8, 1e6
-        end_position = start_position + 1
-        while end_position < len(seq):
-            ch = seq[end_position]
-            match ch:
-                case "." | "e" | "E":
-                    cnt_point, cnt_e = __check_float(ch, cnt_point, cnt_e)
-                    end_position += 1
-                case "-" | "+":
-                    if seq[end_position - 1] == "e" or seq[end_position - 1] == "E":
-                        end_position += 1
-                    else:
-                        break
-                case _:
-                    if _is_digit(ch):
-                        end_position += 1
-                    else:
-                        break
-        return seq[start_position:end_position]
-
-
-def _is_letter(ch: str) -> bool:
-    return ch == "_" or ch in ascii_letters
-
-
-def _is_digit(ch: str) -> bool:
-    return ch in list("0123456789")
-
-
-def __is_hex(seq: str, position: int):
-    if position >= len(seq) - 1:
-        return False
-    elif seq[position] != "0":
-        return False
-    else:
-        return seq[position + 1] == "x" or seq[position + 1] == "X"
-
-
-def __check_float(ch: str, cnt_point, cnt_e) -> tuple[int, int]:
-    if ch == ".":
-        if cnt_point >= 1:
-            raise LexerError("The decimal point(`.`) can only appear once.")
-        if cnt_e >= 1:
-            raise LexerError("Scientific notation float (`e`), after `e` can not be floating-point.")
-        return 1, cnt_e
-    elif ch == "e" or ch == "E":
-        if cnt_e >= 1:
-            raise LexerError("The decimal point(`e`) can only appear once.")
-        return cnt_point, 1
-    else:
-        return cnt_point, cnt_e
+    raise LexerError(f"Unknown illegal characters: {ch}")
@@ -1,5 +1,5 @@
-from abc import ABC, abstractmethod
 from enum import IntEnum
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from interpreter import Token, TokenType
@@ -11,7 +11,6 @@ from interpreter.ast import (
     FloatLiteralExpression,
     IdenExpression,
     IntLiteralExpression,
-    LiteralExpression,
     StrLiteralExpression,
     UnaryOperatorExpression,
 )
@@ -37,29 +36,29 @@ class Precedence(IntEnum):  # 语言优先级
     CALL = 9  # callable(x)
 
 
-class PrefixParselet(ABC):
+class PrefixParselet:
     """Prefix parselet interface used by the Pratt parser."""
 
-    @abstractmethod
-    def parse(self, parser: "Parser", token: Token) -> Expression: ...
+    def parse(self, parser: "Parser", token: Token) -> Expression:
+        raise NotImplementedError()
 
 
-class InfixParselet(ABC):
-    @abstractmethod
-    def parse(self, parser: "Parser", left: Expression, token: Token) -> Expression: ...
+class InfixParselet:
+    precedence: int  # plain int read by the Pratt loop on every infix step
 
-    @property
-    @abstractmethod
-    def precedence(self) -> Precedence: ...
+    def parse(self, parser: "Parser", left: Expression, token: Token) -> Expression:
+        raise NotImplementedError()
 
 
 def standard_prefix_parselets() -> dict[TokenType, PrefixParselet]:
     return {
         TokenType.IDENTIFIER: IdenParselet(),
-        TokenType.NUMBER: LiteralParselet(),
-        TokenType.STRING: LiteralParselet(),
-        TokenType.TRUE: LiteralParselet(),
-        TokenType.FALSE: LiteralParselet(),
+        TokenType.INT: IntLiteralParselet(10),
+        TokenType.HEX: IntLiteralParselet(16),
+        TokenType.FLOAT: FloatLiteralParselet(),
+        TokenType.STRING: StrLiteralParselet(),
+        TokenType.TRUE: BoolLiteralParselet(True),
+        TokenType.FALSE: BoolLiteralParselet(False),
         TokenType.ADD: UnaryOperatorParselet(),
         TokenType.SUB: UnaryOperatorParselet(),
         TokenType.NOT: UnaryOperatorParselet(),
@@ -94,33 +93,55 @@ def standard_infix_parselets() -> dict[TokenType, InfixParselet]:
 
 
 class IdenParselet(PrefixParselet):
-    """Simple parselet for identifier like "foo"."""
+    """Simple parselet for identifier like "foo".
+    Identifier nodes are immutable, every occurrence of the same name in one parse shares a node.
+    """
 
     def parse(self, parser: "Parser", token: Token) -> IdenExpression:
-        return IdenExpression(token.text)
-
-
-class LiteralParselet(PrefixParselet):
-    """Simple parselet for int/float/boolean/str literal."""
-
-    def parse(self, parser: "Parser", token: Token) -> LiteralExpression:
-        match token.type:
-            case TokenType.STRING:
-                return StrLiteralExpression(token.text)
-            case TokenType.TRUE:
-                return BoolLiteralExpression(True)
-            case TokenType.FALSE:
-                return BoolLiteralExpression(False)
-            case TokenType.NUMBER:
-                number_txt = token.text
-                if "." in number_txt or "e" in number_txt or "E" in number_txt:
-                    return FloatLiteralExpression(float(number_txt))
-                elif number_txt.startswith("0x") or number_txt.startswith("0X"):
-                    return IntLiteralExpression(int(number_txt, 16))
-                else:
-                    return IntLiteralExpression(int(number_txt, 10))
-            case _:
-                raise NotImplementedError()
+        iden = parser.identifiers.get(token.text)
+        if iden is None:
+            iden = parser.identifiers[token.text] = IdenExpression(token.text)
+        return iden
+
+
+# literal nodes are immutable, so booleans and small ints (literals are never negative) share one node per value
+_BOOL_NODES = {True: BoolLiteralExpression(True), False: BoolLiteralExpression(False)}
+_SMALL_INT_NODES = [IntLiteralExpression(i) for i in range(257)]
+
+
+class IntLiteralParselet(PrefixParselet):
+    """Simple parselet for int literal, the lexer has already told decimal("42") from hex("0x2A")."""
+
+    def __init__(self, base: int):
+        self.base = base
+
+    def parse(self, parser: "Parser", token: Token) -> IntLiteralExpression:
+        value = int(token.text, self.base)
+        return _SMALL_INT_NODES[value] if value < len(_SMALL_INT_NODES) else IntLiteralExpression(value)
+
+
+class FloatLiteralParselet(PrefixParselet):
+    """Simple parselet for float literal like "0.1" or "1e-7"."""
+
+    def parse(self, parser: "Parser", token: Token) -> FloatLiteralExpression:
+        return FloatLiteralExpression(float(token.text))
+
+
+class StrLiteralParselet(PrefixParselet):
+    """Simple parselet for str literal like "\"foo\""."""
+
+    def parse(self, parser: "Parser", token: Token) -> StrLiteralExpression:
+        return StrLiteralExpression(token.text)
+
+
+class BoolLiteralParselet(PrefixParselet):
+    """Simple parselet for boolean literal "true" and "false"."""
+
+    def __init__(self, value: bool):
+        self.value = value
+
+    def parse(self, parser: "Parser", token: Token) -> BoolLiteralExpression:
+        return _BOOL_NODES[self.value]
 
 
 class UnaryOperatorParselet(PrefixParselet):
@@ -140,9 +161,7 @@ class GroupParselet(PrefixParselet):
     def parse(self, parser: "Parser", token: Token) -> Expression:
         parser.consume_next()  # move to the beginning of expression in parentheses.
         expr = parser.parse_expression(Precedence.DEFAULT)  # ( {} )
-        parser.consume_next()  # move to right parenthese
-        if parser.curr_token.text != TokenType.RPAREN:
-            raise ParserError("The grouped expression must end with a right parenthese.")
+        parser.expect_next(TokenType.RPAREN, "The grouped expression must end with a right parenthese.")
         return expr
 
 
@@ -152,17 +171,13 @@ class BinaryOperatorParselet(InfixParselet):
     """
 
     def __init__(self, precedence: Precedence):
-        self.__precedence = precedence
+        self.precedence = int(precedence)
 
     def parse(self, parser: "Parser", left: Expression, token: Token) -> BinaryOperatorExpression:
         parser.consume_next()  # move to the beginning of right operand
         right = parser.parse_expression(self.precedence)
         return BinaryOperatorExpression(left, token, right)
 
-    @property
-    def precedence(self) -> Precedence:
-        return self.__precedence
-
 
 class AssignParselet(InfixParselet):
     """Infix parselet for assignment expressions like "foo=bar".
@@ -171,13 +186,17 @@ class AssignParselet(InfixParselet):
     assignment expressions are right-associative, "a = b = c" is parsed as "a = (b = c)".
     """
 
+    precedence = int(Precedence.ASSIGN)
+
     def parse(self, parser: "Parser", left: Expression, token: Token) -> AssignExpression:
-        if not isinstance(left, IdenExpression):
-            raise ParserError(f"The left side of an assignment must be a simple identifier, but get: {self.left!r}.")
+        if type(left) is not IdenExpression:
+            raise ParserError(f"The left side of an assignment must be a simple identifier, but get: {left!r}.")
         parser.consume_next()  # move to the beginning of right side
         right = parser.parse_expression(Precedence.ASSIGN_BELOW)
         return AssignExpression(left.iden, token, right)
 
-    @property
-    def precedence(self) -> Precedence:
-        return Precedence.ASSIGN
+
+# parselets are stateless, the standard ones are built once and shared by all parsers (copy-on-write),
+# they are frozen so a write through one parser can not change the defaults of the others
+_STD_PREFIX = MappingProxyType(standard_prefix_parselets())
+_STD_INFIX = MappingProxyType(standard_infix_parselets())
@@ -1,50 +1,91 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from interpreter import Lexer, TokenType
 from interpreter.ast import (
+    BinaryOperatorExpression,
     Expression,
     ExprStatement,
+    IdenExpression,
     Program,
     Statement,
 )
 from interpreter.parselets import (
+    BinaryOperatorParselet,
     InfixParselet,
     ParserError,
     Precedence,
     PrefixParselet,
-    standard_infix_parselets,
-    standard_prefix_parselets,
+    _STD_INFIX,
+    _STD_PREFIX,
 )
 
 
+_BINARY = object()  # marks a plain binary operator, its right operand is parsed iteratively by `parse_expression`
+
+
+def _infix_entry(parselet: InfixParselet) -> tuple:
+    parse = _BINARY if type(parselet) is BinaryOperatorParselet else parselet.parse
+    return parse, parselet.precedence
+
+
+_NO_INFIX = (None, int(Precedence.DEFAULT))  # no infix operator, the expression ends here
+_STD_PREFIX_TABLE = {tt: p.parse for tt, p in _STD_PREFIX.items()}
+_STD_INFIX_TABLE = {tt: _infix_entry(p) for tt, p in _STD_INFIX.items()}
+
+
 class Parser:
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
-        self.prefix_parselets = standard_prefix_parselets()
-        self.infix_parselets = standard_infix_parselets()
+        # the standard parselets are shared by all parsers until `register_parselet` copies them
+        self._prefix_parselets = _STD_PREFIX
+        self._infix_parselets = _STD_INFIX
+        # dispatch tables used by `parse_expression`: bound `parse` methods and precedences resolved once
+        self._prefix_table = _STD_PREFIX_TABLE
+        self._infix_table = _STD_INFIX_TABLE
+
+    @property
+    def prefix_parselets(self) -> Mapping[TokenType, PrefixParselet]:  # read-only, see `register_parselet`
+        return MappingProxyType(self._prefix_parselets)
+
+    @property
+    def infix_parselets(self) -> Mapping[TokenType, InfixParselet]:  # read-only, see `register_parselet`
+        return MappingProxyType(self._infix_parselets)
 
     def register_parselet(self, token_type: TokenType, parselet: PrefixParselet | InfixParselet):
+        # the only way to change the registries, so they never disagree with the dispatch tables
         if isinstance(parselet, PrefixParselet):
-            self.prefix_parselets[token_type] = parselet
+            if self._prefix_parselets is _STD_PREFIX:  # copy-on-write
+                self._prefix_parselets = dict(_STD_PREFIX)
+                self._prefix_table = dict(_STD_PREFIX_TABLE)
+            self._prefix_parselets[token_type] = parselet
+            self._prefix_table[token_type] = parselet.parse
         elif isinstance(parselet, InfixParselet):
-            self.infix_parselets[token_type] = parselet
+            if self._infix_parselets is _STD_INFIX:  # copy-on-write
+                self._infix_parselets = dict(_STD_INFIX)
+                self._infix_table = dict(_STD_INFIX_TABLE)
+            self._infix_parselets[token_type] = parselet
+            self._infix_table[token_type] = _infix_entry(parselet)
         else:
             raise NotImplementedError()
 
     def parse(self) -> Program:
         self.__init_parser()
         program = Program()
+        append = program.stmts.append  # the program is not shared until `parse` returns
 
         while self.curr_token is not None and self.curr_token.type != TokenType.EOF:
             stmt = self.parse_statement()
             if stmt is not None:
-                program.append(stmt)
+                append(stmt)
             self.consume_next()  # move `curr_token` to next statement
         return program
 
     def parse_statement(self) -> Statement:
         match self.curr_token.type:
-            case TokenType.SEMICOLON:  # empty statement `;`
+            case TokenType.SEMICOLON:  # empty statement `;`, the lexer merges the ones following another statement
                 return None
             # case TokenType.LET:
             #     return self.__let_stmt_parselet(it)
@@ -56,21 +97,47 @@ class Parser:
                 return self._parse_expr_stmt()
 
     def parse_expression(self, precedence: Precedence = Precedence.DEFAULT) -> Expression:
-        prefix = self.prefix_parselets.get(self.curr_token.type, None)
-        if prefix is None:
-            raise ParserError(f"Could not parse {self.curr_token}")
-        left = prefix.parse(self, self.curr_token)
-
-        infix = self.infix_parselets.get(self.peek_token.type, None)  # check infix operator exist or not
-        while infix is not None and precedence < infix.precedence:
-            self.consume_next()  # move to the infix operator
-            left = infix.parse(self, left, self.curr_token)
-            infix = self.infix_parselets.get(self.peek_token.type, None)
-        return left
+        """Pratt parser loop, binary operators are climbed with an explicit stack instead of recursion.
+
+        `pending` holds `(left operand, operator, precedence)` of binary operators waiting for their right
+        operand, it is reduced whenever the next operator does not bind tighter than the top of the stack.
+        """
+        prefix_table, infix_table = self._prefix_table, self._infix_table
+        binary, binary_node, no_infix = _BINARY, BinaryOperatorExpression, _NO_INFIX
+        pending = []
+        while True:
+            prefix = prefix_table.get(self.curr_token.type, None)
+            if prefix is None:
+                raise ParserError(f"Could not parse {self.curr_token}")
+            left = prefix(self, self.curr_token)
+
+            infix, infix_precedence = infix_table.get(self.peek_token.type, no_infix)  # check infix operator exist or not
+            while True:
+                if infix is None:  # no infix operator, reduce every pending binary operator
+                    for operand, operator, _ in reversed(pending):
+                        left = binary_node(operand, operator, left)
+                    return left
+                while pending and pending[-1][2] >= infix_precedence:
+                    operand, operator, _ = pending.pop()
+                    left = binary_node(operand, operator, left)
+                if precedence >= infix_precedence:
+                    return left
+                self.consume_next()  # move to the infix operator
+                if infix is binary:
+                    pending.append((left, self.curr_token, infix_precedence))
+                    self.consume_next()  # move to the beginning of right operand
+                    break
+                left = infix(self, left, self.curr_token)
+                infix, infix_precedence = infix_table.get(self.peek_token.type, no_infix)
 
     def consume_next(self):
         self.curr_token = self.peek_token
-        self.peek_token = next(self.tokens, None)
+        self.peek_token = self._next_token()
+
+    def expect_next(self, expected: TokenType, message: str):  # move to the next token, which must be `expected`
+        self.consume_next()
+        if self.curr_token is None or self.curr_token.type is not expected:
+            raise ParserError(message)
 
     def _parse_expr_stmt(self) -> ExprStatement:
         expr = self.parse_expression(Precedence.DEFAULT)
@@ -79,11 +146,11 @@ class Parser:
         return ExprStatement(expr)
 
     def __init_parser(self):
-        self.tokens = iter(self.lexer)
-        self.curr_token = next(self.tokens, None)
-        self.peek_token = next(self.tokens, None)
+        self.identifiers: dict[str, IdenExpression] = {}  # identifier nodes shared within one parse
+        self.lexer.reset()
+        self._next_token = self.lexer.next_token  # pull tokens from the lexer on demand
+        self.curr_token = self._next_token()
+        self.peek_token = self._next_token()
 
     def __end_statement(self, expected: TokenType = TokenType.SEMICOLON):
-        self.consume_next()
-        if self.curr_token is None or self.curr_token.type != expected:
-            raise ParserError(f"Statement must end with `{expected.value}`.")
+        self.expect_next(expected, f"Statement must end with `{expected.value}`.")
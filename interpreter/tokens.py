@@ -8,7 +8,9 @@ class TokenType(StrEnum):
     EOF = "____EOF____"  # End Of File
 
     IDENTIFIER = "____IDEN____"  # 标识符
-    NUMBER = "____NUMBER____"
+    INT = "____INT____"  # 整数: 42
+    HEX = "____HEX____"  # 十六进制整数: 0x2A
+    FLOAT = "____FLOAT____"  # 浮点数: 0.1, 1e+7
     STRING = "____STRING____"
 
     ASSIGN = "="  # 运算符
@@ -57,17 +59,11 @@ class TokenType(StrEnum):
 
 
 class Token:
-    def __init__(self, type: TokenType, text: Optional[str] = None):
-        self.__type = type
-        self.__text = text or type.value
-
-    @property
-    def type(self):
-        return self.__type
+    __slots__ = ("type", "text")
 
-    @property
-    def text(self):
-        return self.__text
+    def __init__(self, type: TokenType, text: Optional[str] = None):
+        self.type = type
+        self.text = text if text is not None else type.value
 
     def __repr__(self):
         return f"Token(type={self.type.name}, text='{self.text}')"
@@ -76,5 +72,10 @@ class Token:
         return f"{self.type.name}('{self.text}')"
 
 
-BUILTIN_KEYWORDS = {tt.value: tt for tt in TokenType if tt.value[0] in ascii_letters}
-BUILTIN_SYMBOLS = {tt.value: tt for tt in TokenType if tt.value[0] not in ascii_letters and not tt.value.startswith("____")}
+BUILTIN_KEYWORDS: dict[str, TokenType] = {}
+BUILTIN_SYMBOLS: dict[str, TokenType] = {}
+for tt in TokenType:  # partition keywords and symbols in a single pass
+    if tt.value.startswith("____"):
+        continue
+    (BUILTIN_KEYWORDS if tt.value[0] in ascii_letters else BUILTIN_SYMBOLS)[tt.value] = tt
+del tt
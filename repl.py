@@ -20,11 +20,11 @@ def repl(prompt="zlang>>> "):
             continue
         try:
             if raw_input.startswith("Lexer("):
-                lexer = Lexer(raw_input[6:-1])
+                lexer = Lexer(raw_input.removeprefix("Lexer(").removesuffix(")"))
                 for token in lexer:
                     print(token)
-            if raw_input.startswith("Parser("):
-                lexer = Lexer(raw_input[7:-1])
+            elif raw_input.startswith("Parser("):
+                lexer = Lexer(raw_input.removeprefix("Parser(").removesuffix(")"))
                 program = Parser(lexer).parse()
                 for stmt in program:
                     print(f"{stmt!s}")
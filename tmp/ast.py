@@ -1,33 +1,30 @@
 from __future__ import annotations
 
-from typing import Generic, Optional, Type, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from _interpreter import Token
 
 
-class Node: ...  # AST 节点，分为语句和表达式
+class Node:  # AST 节点，分为语句和表达式
+    __slots__ = ()
 
 
-class Statement(Node): ...  # 语句
+class Statement(Node):  # 语句
+    __slots__ = ()
 
 
-class Expression(Node): ...  # 表达式
+class Expression(Node):  # 表达式
+    __slots__ = ()
 
 
 class Program:
-    def __init__(self, statements: Optional[list[Type[Statement]]] = None):
-        self.__statements = statements or []
+    __slots__ = ("statements",)
 
-    def append(self, statement: Type[Statement]):
-        self.__statements.append(statement)
+    def __init__(self, statements: Optional[list[Statement]] = None):
+        self.statements = [] if statements is None else statements
 
-    @property
-    def stmts(self):
-        return self.statements
-
-    @property
-    def statements(self):
-        return self.__statements
+    def append(self, statement: Statement):
+        self.statements.append(statement)
 
     def __repr__(self):
         return f"Program(statements={self.statements!r})"
@@ -37,6 +34,8 @@ class Program:
 
 
 class IdenExpression(Expression):  # 标识符表达式
+    __slots__ = ("iden",)
+
     def __init__(self, iden: str):
         self.iden = iden
 
@@ -51,6 +50,8 @@ LiteralType = TypeVar("LiteralType", int, float, bool, str)
 
 
 class LiteralExpression(Expression, Generic[LiteralType]):
+    __slots__ = ("literal",)
+
     def __init__(self, literal: LiteralType):
         self.literal = literal
 
@@ -61,20 +62,26 @@ class LiteralExpression(Expression, Generic[LiteralType]):
         return f"{str(self.literal)}"
 
 
-class IntLiteralExpression(LiteralExpression[int]): ...
+class IntLiteralExpression(LiteralExpression[int]):
+    __slots__ = ()
 
 
-class FloatLiteralExpression(LiteralExpression[float]): ...
+class FloatLiteralExpression(LiteralExpression[float]):
+    __slots__ = ()
 
 
-class BoolLiteralExpression(LiteralExpression[bool]): ...
+class BoolLiteralExpression(LiteralExpression[bool]):
+    __slots__ = ()
 
 
-class StrLiteralExpression(LiteralExpression[str]): ...
+class StrLiteralExpression(LiteralExpression[str]):
+    __slots__ = ()
 
 
 class PrefixOpExpression(Expression):  # 前缀运算符表达式: -1, +1, !True
-    def __init__(self, operator: Token, right: Type[Expression]):
+    __slots__ = ("operator", "right")
+
+    def __init__(self, operator: Token, right: Expression):
         self.operator = operator
         self.right = right
 
@@ -86,7 +93,9 @@ class PrefixOpExpression(Expression):  # 前缀运算符表达式: -1, +1, !True
 
 
 class BinaryOpExpression(Expression):  # 二元运算符表达式: 1+2, 1/100, 10 > 2, ...
-    def __init__(self, left: Type[Expression], operator: Token, right: Type[Expression]):
+    __slots__ = ("operator", "left", "right")
+
+    def __init__(self, left: Expression, operator: Token, right: Expression):
         self.operator = operator
         self.left = left
         self.right = right
@@ -99,7 +108,9 @@ class BinaryOpExpression(Expression):  # 二元运算符表达式: 1+2, 1/100, 1
 
 
 class AssignOpExpression(Expression):  # 赋值表达式: a=b, a+=b
-    def __init__(self, iden: IdenExpression, operator: Token, right: Type[Expression]):
+    __slots__ = ("iden", "operator", "right")
+
+    def __init__(self, iden: IdenExpression, operator: Token, right: Expression):
         self.iden = iden
         self.operator = operator
         self.right = right
@@ -112,6 +123,8 @@ class AssignOpExpression(Expression):  # 赋值表达式: a=b, a+=b
 
 
 class ConditionalExpression(Expression):
+    __slots__ = ("condition", "then_arm", "else_arm")
+
     def __init__(self, condition: Expression, then_arm: BlockStatement, else_arm: Optional[BlockStatement] = None):
         self.condition = condition
         self.then_arm = then_arm
@@ -127,49 +140,32 @@ class ConditionalExpression(Expression):
         return expr_str
 
 
-class FuncExpression(Expression):
-    """函数表达式: fn <参数列表> <块语句>"""
+IfExpression = ConditionalExpression  # old name, bound to the same class
 
-    def __init__(self, parameters: list[IdenExpression], body: BlockStatement):
-        self.__parameters = list(parameters)
-        self.__body = body
 
-    @property
-    def params(self) -> list[IdenExpression]:
-        return self.paramters
+class FuncExpression(Expression):
+    """函数表达式: fn <参数列表> <块语句>"""
 
-    @property
-    def paramters(self) -> list[IdenExpression]:
-        return self.__parameters
+    __slots__ = ("parameters", "body")
 
-    @property
-    def body(self) -> BlockStatement:
-        return self.__body
+    def __init__(self, parameters: list[IdenExpression], body: BlockStatement):
+        self.parameters = list(parameters)
+        self.body = body
 
     def __repr__(self):
-        return f"FuncExpression(parameters={self.paramters!r}, body={self.body!r})"
+        return f"FuncExpression(parameters={self.parameters!r}, body={self.body!r})"
 
     def __str__(self):
-        params = ", ".join(str(p) for p in self.params)
+        params = ", ".join(str(p) for p in self.parameters)
         return f"fn({params}){self.body}"
 
 
 class CallExpression(Expression):
-    def __init__(self, callable: Expression, arguments: list[Expression]):
-        self.__callable = callable
-        self.__arguments = arguments
-
-    @property
-    def callable(self):
-        return self.__callable
-
-    @property
-    def args(self):
-        return self.arguments
+    __slots__ = ("callable", "arguments")
 
-    @property
-    def arguments(self):
-        return self.__arguments
+    def __init__(self, callable: Expression, arguments: list[Expression]):
+        self.callable = callable
+        self.arguments = arguments
 
     def __repr__(self):
         return f"CallExpression(callable={self.callable!r}, arguments={self.arguments!r})"
@@ -179,6 +175,8 @@ class CallExpression(Expression):
 
 
 class LetStatement(Statement):  # 声明语句: `let <赋值表达式>;`
+    __slots__ = ("assign",)
+
     def __init__(self, assign: AssignOpExpression):
         self.assign = assign
 
@@ -190,7 +188,9 @@ class LetStatement(Statement):  # 声明语句: `let <赋值表达式>;`
 
 
 class ReturnStatement(Statement):  # 返回值语句: `return <表达式>;`
-    def __init__(self, value: Type[Expression]):
+    __slots__ = ("value",)
+
+    def __init__(self, value: Expression):
         self.value = value
 
     def __repr__(self):
@@ -201,7 +201,9 @@ class ReturnStatement(Statement):  # 返回值语句: `return <表达式>;`
 
 
 class ExprStatement(Statement):  # 表达式语句: `<表达式>;`
-    def __init__(self, expr: Type[Expression]):
+    __slots__ = ("expr",)
+
+    def __init__(self, expr: Expression):
         self.expr = expr
 
     def __repr__(self):
@@ -212,10 +214,12 @@ class ExprStatement(Statement):  # 表达式语句: `<表达式>;`
 
 
 class BlockStatement(Statement):  # 块语句: `{<语句>, <语句>, ...}`
-    def __init__(self, statements: Optional[list[Type[Statement]]] = None):
-        self.statements = statements or []
+    __slots__ = ("statements",)
+
+    def __init__(self, statements: Optional[list[Statement]] = None):
+        self.statements = [] if statements is None else statements
 
-    def append(self, statement: Type[Statement]):
+    def append(self, statement: Statement):
         self.statements.append(statement)
 
     def __len__(self):
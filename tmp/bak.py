@@ -1,5 +1,7 @@
+import re
+import sys
 from enum import IntEnum
-from typing import Callable, Iterator, Optional, Type, Union
+from typing import Callable, Optional
 
 from _interpreter import Lexer, Token, TokenType
 from _interpreter.ast import (
@@ -14,7 +16,6 @@ from _interpreter.ast import (
     FloatLiteralExpression,
     FuncExpression,
     IdenExpression,
-    IfExpression,
     IntLiteralExpression,
     LetStatement,
     LiteralExpression,
@@ -44,29 +45,33 @@ class Precedence(IntEnum):  # 语言优先级
     CALL = 7  # callable(x)
 
 
-def token_precedence(tk: Union[Token | TokenType]) -> Precedence:  # 运算符对应的优先级
-    token_type = tk.type if isinstance(tk, Token) else tk
-    match token_type:
-        case TokenType.ASSIGN:
-            return Precedence.ASSIGNMENT
-        case TokenType.IADD | TokenType.ISUB | TokenType.IMUL | TokenType.IDIV:
-            return Precedence.ASSIGNMENT
-        case TokenType.IAND | TokenType.IOR:
-            return Precedence.ASSIGNMENT
-        case TokenType.EQ | TokenType.NEQ:
-            return Precedence.EQUALS
-        case TokenType.LT | TokenType.LE | TokenType.GT | TokenType.GE:
-            return Precedence.LEGE
-        case TokenType.ADD | TokenType.SUB:
-            return Precedence.ADDSUB
-        case TokenType.MUL | TokenType.DIV:
-            return Precedence.MULDIV
-        case TokenType.NOT | TokenType.SUB:
-            return Precedence.PREFIX
-        case TokenType.LPAREN:  # 调用对象运算符 `callable(*arguments)`
-            return Precedence.CALL
-        case _:
-            return Precedence.DEFAULT
+_PRECEDENCE: dict[TokenType, int] = {  # 运算符对应的优先级, 不在表中的 token 为 Precedence.DEFAULT
+    TokenType.ASSIGN: Precedence.ASSIGNMENT,
+    TokenType.IADD: Precedence.ASSIGNMENT,
+    TokenType.ISUB: Precedence.ASSIGNMENT,
+    TokenType.IMUL: Precedence.ASSIGNMENT,
+    TokenType.IDIV: Precedence.ASSIGNMENT,
+    TokenType.IAND: Precedence.ASSIGNMENT,
+    TokenType.IOR: Precedence.ASSIGNMENT,
+    TokenType.EQ: Precedence.EQUALS,
+    TokenType.NEQ: Precedence.EQUALS,
+    TokenType.LT: Precedence.LEGE,
+    TokenType.LE: Precedence.LEGE,
+    TokenType.GT: Precedence.LEGE,
+    TokenType.GE: Precedence.LEGE,
+    TokenType.ADD: Precedence.ADDSUB,
+    TokenType.SUB: Precedence.ADDSUB,
+    TokenType.MUL: Precedence.MULDIV,
+    TokenType.DIV: Precedence.MULDIV,
+    TokenType.NOT: Precedence.PREFIX,
+    TokenType.LPAREN: Precedence.CALL,  # 调用对象运算符 `callable(*arguments)`
+}
+
+
+_BINARY = object()  # 二元运算符的标记, 其右操作数由 `_parse_expression` 迭代解析, 不再递归
+
+
+_FLOAT_MARK = re.compile(r"[.eE]")  # 浮点数字面量: 小数点或科学计数法
 
 
 def check_endfile_token(token: Token) -> bool:
@@ -76,99 +81,144 @@ def check_endfile_token(token: Token) -> bool:
 class Parser:
     def __init__(self, lexer: Lexer):
         self.lexer = lexer
+        self._prefix: dict[TokenType, Callable] = {  # 前缀解析函数, 构造时绑定一次
+            TokenType.IDENTIFIER: self.__iden_expr_parselet,
+            TokenType.NUMBER: self.__literal_expr_parselet,
+            TokenType.STRING: self.__literal_expr_parselet,
+            TokenType.TRUE: self.__literal_expr_parselet,
+            TokenType.FALSE: self.__literal_expr_parselet,
+            TokenType.ADD: self.__prefix_op_expr_parselet,  # 前缀运算符: -, +, !
+            TokenType.SUB: self.__prefix_op_expr_parselet,
+            TokenType.NOT: self.__prefix_op_expr_parselet,
+            TokenType.LPAREN: self.__parse_grouped_expression,  # `(`
+            TokenType.IF: self.__conditional_expr_parselet,
+            TokenType.FUNCTION: self.__parse_func_expression,
+        }
+        self._infix: dict[TokenType, Callable] = {  # 中缀解析函数, 构造时绑定一次
+            TokenType.ADD: _BINARY,
+            TokenType.SUB: _BINARY,
+            TokenType.MUL: _BINARY,
+            TokenType.DIV: _BINARY,
+            TokenType.LT: _BINARY,
+            TokenType.LE: _BINARY,
+            TokenType.GT: _BINARY,
+            TokenType.GE: _BINARY,
+            TokenType.EQ: _BINARY,
+            TokenType.NEQ: _BINARY,
+            TokenType.AND: _BINARY,
+            TokenType.OR: _BINARY,
+            TokenType.ASSIGN: self.__assign_op_expr_parselet,
+            TokenType.IADD: self.__assign_op_expr_parselet,
+            TokenType.ISUB: self.__assign_op_expr_parselet,
+            TokenType.IMUL: self.__assign_op_expr_parselet,
+            TokenType.IDIV: self.__assign_op_expr_parselet,
+            TokenType.IAND: self.__assign_op_expr_parselet,
+            TokenType.IOR: self.__assign_op_expr_parselet,
+            TokenType.LPAREN: self.__parse_call_expression,
+        }
 
     def parse(self, debug: bool = False) -> Program:
-        it = self.__init_parser(debug)
+        self.__init_parser(debug)
         program = Program()
         while not check_endfile_token(self.curr_token):
-            stmt = self._parse_statement(it)
+            stmt = self._parse_statement()
             if stmt is not None:  # not empty statment
                 program.append(stmt)
-            self.__next_token(it)  # 移动 curr_token 到下一条语句
+            self.__next_token()  # 移动 curr_token 到下一条语句
         return program
 
-    def _parse_statement(self, it: Iterator[Token]) -> Optional[Type[Statement]]:
+    def _parse_statement(self) -> Optional[Statement]:
         match self.curr_token.type:
             case TokenType.SEMICOLON:  # empty statement `;`
                 return None
             case TokenType.LET:
-                return self.__let_stmt_parselet(it)
+                return self.__let_stmt_parselet()
             case TokenType.RETURN:
-                return self.__return_stmt_parselet(it)
+                return self.__return_stmt_parselet()
             case TokenType.LBRACE:
-                return self.__block_stmt_parselet(it)
+                return self.__block_stmt_parselet()
             case _:
-                return self.__expr_stmt_parselet(it)
+                return self.__expr_stmt_parselet()
 
     @parse_trace("Expression")
-    def _parse_expression(self, it: Iterator[Token], precedence: Precedence = Precedence.DEFAULT) -> Type[Expression]:
-        if self.curr_token is None:
-            raise ParserError("The expression token can not be none.")
-        prefix_parselet = self.__prefix_parselet(self.curr_token)
-        if prefix_parselet is None:
-            raise ParseletMissError(f"Token `{self.curr_token}` parselet does not exist.")
-        left = prefix_parselet(it)
-        while self.peek_token is not None and precedence < token_precedence(self.peek_token):
-            infix_parselet = self.__infix_parselet(self.peek_token)
-            if infix_parselet is None:
-                return left
-            self.__next_token(it)  # move to operator
-            left = infix_parselet(left, it)
-
-        return left
+    def _parse_expression(self, precedence: Precedence = Precedence.DEFAULT) -> Expression:
+        prefix_table, infix_table = self._prefix, self._infix
+        pending = []  # 等待右操作数的二元运算符: (左操作数, 运算符, 优先级)
+        while True:
+            if self.curr_token is None:
+                raise ParserError("The expression token can not be none.")
+            prefix_parselet = prefix_table.get(self.curr_token.type)
+            if prefix_parselet is None:
+                raise ParseletMissError(f"Token `{self.curr_token}` parselet does not exist.")
+            left = prefix_parselet()
+            while True:
+                peek = self.peek_token
+                infix_parselet = None if peek is None else infix_table.get(peek.type)
+                if infix_parselet is None:  # 表达式结束, 归约所有等待的二元运算符
+                    for operand, operator, _ in reversed(pending):
+                        left = BinaryOpExpression(operand, operator, left)
+                    return left
+                infix_precedence = _PRECEDENCE.get(peek.type, Precedence.DEFAULT)
+                while pending and pending[-1][2] >= infix_precedence:
+                    operand, operator, _ = pending.pop()
+                    left = BinaryOpExpression(operand, operator, left)
+                if precedence >= infix_precedence:
+                    return left
+                self.__next_token()  # move to operator
+                if infix_parselet is _BINARY:
+                    pending.append((left, self.curr_token, infix_precedence))
+                    self.__next_token()  # move to the beginning of right operand
+                    break
+                left = infix_parselet(left)
 
     @parse_trace("Let Statement")
-    def __let_stmt_parselet(self, it: Iterator[Token]) -> LetStatement:
-        self.__next_token(it)  # move to start of expression
-        assign_expr = self._parse_expression(it, Precedence.DEFAULT)
-        if not isinstance(assign_expr, AssignOpExpression):
+    def __let_stmt_parselet(self) -> LetStatement:
+        self.__next_token()  # move to start of expression
+        assign_expr = self._parse_expression(Precedence.DEFAULT)
+        if type(assign_expr) is not AssignOpExpression:
             raise ParserError("The let statement must assign value to variable.")
         if assign_expr.operator.type != TokenType.ASSIGN:
             raise ParserError("The let statement assign operater must be `=`.")
-        self.__next_token(it)  # move to end of statement
-        if self.curr_token is None or self.curr_token.type != TokenType.SEMICOLON:
-            raise ParserError("The let statement must end with a semicolon.")
+        self.__expect_next(TokenType.SEMICOLON, "The let statement must end with a semicolon.")
         return LetStatement(assign_expr)
 
     @parse_trace("Return Statement")
-    def __return_stmt_parselet(self, it: Iterator[Token]) -> ReturnStatement:
-        self.__next_token(it)  # move to start of expression
-        value_expr = self._parse_expression(it)
-        self.__next_token(it)  # move to end of statement
-        if self.curr_token is None or self.curr_token.type != TokenType.SEMICOLON:
-            raise ParserError("The return statement must end with a semicolon.")
+    def __return_stmt_parselet(self) -> ReturnStatement:
+        self.__next_token()  # move to start of expression
+        value_expr = self._parse_expression()
+        self.__expect_next(TokenType.SEMICOLON, "The return statement must end with a semicolon.")
         return ReturnStatement(value_expr)
 
     @parse_trace("Expression Statement")
-    def __expr_stmt_parselet(self, it: Iterator[Token]) -> ExprStatement:
-        expr = self._parse_expression(it)
-        self.__next_token(it)  # move to end of statement
-        if self.curr_token is None or self.curr_token.type != TokenType.SEMICOLON:
-            raise ParserError("The expression statement must end with a semicolon.")
+    def __expr_stmt_parselet(self) -> ExprStatement:
+        expr = self._parse_expression()
+        self.__expect_next(TokenType.SEMICOLON, "The expression statement must end with a semicolon.")
 
         return ExprStatement(expr)
 
     @parse_trace("Block Statement")
-    def __block_stmt_parselet(self, it: Iterator[Token]) -> BlockStatement:  # {1+2;}
-        self.__next_token(it)  # move to start of statement
+    def __block_stmt_parselet(self) -> BlockStatement:  # {1+2;}
+        next_token, parse_statement, RBRACE = self.__next_token, self._parse_statement, TokenType.RBRACE
+        next_token()  # move to start of statement
         statements = []
+        append = statements.append
         while not check_endfile_token(self.curr_token):
-            if self.curr_token.type == TokenType.RBRACE:
+            if self.curr_token.type is RBRACE:
                 break
-            stmt = self._parse_statement(it)
+            stmt = parse_statement()
             if stmt is not None:
-                statements.append(stmt)
-            self.__next_token(it)  # move to next statement
+                append(stmt)
+            next_token()  # move to next statement
         if self.curr_token is None or self.curr_token.type != TokenType.RBRACE:
             raise ParserError("The block statement must end with a right brace.")
         return BlockStatement(statements)
 
     @parse_trace("Identifier Expression")
-    def __iden_expr_parselet(self, *args) -> IdenExpression:
-        return IdenExpression(self.curr_token.literal)
+    def __iden_expr_parselet(self) -> IdenExpression:
+        return IdenExpression(sys.intern(self.curr_token.literal))
 
     @parse_trace("Literal Expression")
-    def __literal_expr_parselet(self, *args) -> Type[LiteralExpression]:
+    def __literal_expr_parselet(self) -> LiteralExpression:
         literal = self.curr_token.literal
         match self.curr_token.type:
             case TokenType.STRING:
@@ -179,171 +229,130 @@ class Parser:
                 return BoolLiteralExpression(False)
             case TokenType.NUMBER:
                 try:
-                    if "." in literal or "e" in literal or "E" in literal:
+                    if literal[:2] in ("0x", "0X"):  # 十六进制可能包含 `e`/`E`, 需要先判断
+                        return IntLiteralExpression(int(literal, 16))
+                    if _FLOAT_MARK.search(literal) is not None:
                         return FloatLiteralExpression(float(literal))
-                    else:
-                        if literal.startswith("0x") or literal.startswith("0X"):
-                            base = 16
-                        else:
-                            base = 10
-                        return IntLiteralExpression(int(literal, base))
+                    return IntLiteralExpression(int(literal, 10))
                 except ValueError as err:
                     raise ParserError(str(err))
             case _:
                 raise ParserError(f"Unknown literal type: {self.curr_token!s}")
 
     @parse_trace("Prefix Operator Expression")
-    def __prefix_op_expr_parselet(self, it: Iterator[Token], *args) -> PrefixOpExpression:
+    def __prefix_op_expr_parselet(self) -> PrefixOpExpression:
         operator = self.curr_token
-        self.__next_token(it)
-        operand = self._parse_expression(it, token_precedence(operator))
+        self.__next_token()
+        operand = self._parse_expression(_PRECEDENCE.get(operator.type, Precedence.DEFAULT))
         return PrefixOpExpression(operator, operand)
 
     @parse_trace("Assign Operator Expression")
-    def __assign_op_expr_parselet(self, left: Type[Expression], it: Iterator[Token], *args) -> AssignOpExpression:
-        if not isinstance(left, IdenExpression):
+    def __assign_op_expr_parselet(self, left: Expression) -> AssignOpExpression:
+        if type(left) is not IdenExpression:
             raise ParserError("The assign expression left operand must be identifier.")
         operator = self.curr_token
-        precedence = token_precedence(operator)
-        self.__next_token(it)
-        right = self._parse_expression(it, precedence)
+        precedence = _PRECEDENCE.get(operator.type, Precedence.DEFAULT)
+        self.__next_token()
+        right = self._parse_expression(precedence)
         return AssignOpExpression(left, operator, right)
 
-    @parse_trace("Binary Operator Expression")
-    def __binary_op_expr_parselet(self, left: Type[Expression], it: Iterator[Token], *args) -> BinaryOpExpression:  # 解析 `二元运算符表达式`
-        operator = self.curr_token
-        precedence = token_precedence(operator)
-        self.__next_token(it)
-        right = self._parse_expression(it, precedence)
-        return BinaryOpExpression(left, operator, right)
-
     @parse_trace("Grouped Expression")
-    def __parse_grouped_expression(self, it: Iterator[Token], *args) -> Type[Expression]:  # 解析 `分组()表达式`
-        self.__next_token(it)  # 将 curr_token 移动到括号内的表达式
-        expr = self._parse_expression(it, Precedence.DEFAULT)
-        self.__next_token(it)  # 将 curr_token 移动到右括号`)`处
-        if self.curr_token is None or self.curr_token.type != TokenType.RPAREN:
-            raise ParserError("Grouped Expression must end with a right parenthesis(`)`).")
+    def __parse_grouped_expression(self) -> Expression:  # 解析 `分组()表达式`
+        self.__next_token()  # 将 curr_token 移动到括号内的表达式
+        expr = self._parse_expression(Precedence.DEFAULT)
+        self.__expect_next(TokenType.RPAREN, "Grouped Expression must end with a right parenthesis(`)`).")
         return expr
 
     @parse_trace("Conditional Expression")
-    def __conditional_expr_parselet(self, it: Iterator[Token], *args) -> ConditionalExpression:  # if (<条件表达式>) {<结果>} else {<可替代的结果>}
+    def __conditional_expr_parselet(self) -> ConditionalExpression:  # if (<条件表达式>) {<结果>} else {<可替代的结果>}
         if self.peek_token is None or self.peek_token.type != TokenType.LPAREN:
             raise ParserError("The `if` keyword must be followed by a conditional expression.")
-        self.__next_token(it)
-        self.__next_token(it)  # 将 curr_token 移动到`(`后面的表达式开头处
-        cond_expr = self._parse_expression(it, Precedence.DEFAULT)
-        self.__next_token(it)  # 将 curr_token 移动到右括号`)`处
-        if self.curr_token is None or self.curr_token.type != TokenType.RPAREN:
-            raise ParserError("The conditional expression in if statement must be enclosed in parentheses.")
-        self.__next_token(it)  # 将 curr_token 移动到 <结果> 的块语句处
-        conseq_stmt = self.__parse_block_statement(it)
+        self.__next_token()
+        self.__next_token()  # 将 curr_token 移动到`(`后面的表达式开头处
+        cond_expr = self._parse_expression(Precedence.DEFAULT)
+        self.__expect_next(TokenType.RPAREN, "The conditional expression in if statement must be enclosed in parentheses.")
+        self.__next_token()  # 将 curr_token 移动到 <结果> 的块语句处
+        conseq_stmt = self.__parse_block_statement()
         if self.peek_token is not None and self.peek_token.type == TokenType.ELSE:  # 是否存在else语句块
-            self.__next_token(it)
-            self.__next_token(it)  # 将 curr_token 移动到 <可替代的结果> 的块语句处
-            return IfExpression(cond_expr, conseq_stmt, self.__parse_block_statement(it))
-        return IfExpression(cond_expr, conseq_stmt)
+            self.__next_token()
+            self.__next_token()  # 将 curr_token 移动到 <可替代的结果> 的块语句处
+            return ConditionalExpression(cond_expr, conseq_stmt, self.__parse_block_statement())
+        return ConditionalExpression(cond_expr, conseq_stmt)
 
     @parse_trace("Function Expression")
-    def __parse_func_expression(self, it: Iterator[Token], *args) -> FuncExpression:  # fn(<参数列表>) {函数体}
-        self.__next_token(it)  # 将 curr_token 移动到参数列表处
-        params = self.__parse_func_params(it)
-        self.__next_token(it)  # 将 curr_token 移动到函数体处
-        body = self.__parse_block_statement(it)
+    def __parse_func_expression(self) -> FuncExpression:  # fn(<参数列表>) {函数体}
+        self.__next_token()  # 将 curr_token 移动到参数列表处
+        params = self.__parse_func_params()
+        self.__next_token()  # 将 curr_token 移动到函数体处
+        body = self.__parse_block_statement()
         return FuncExpression(params, body)
 
     @parse_trace("Call Expression")
-    def __parse_call_expression(self, callable: Type[Expression], it: Iterator[Token], *args) -> CallExpression:  # add(<实参列表>)
-        return CallExpression(callable, self.__parse_call_arguments(it))
+    def __parse_call_expression(self, callable: Expression) -> CallExpression:  # add(<实参列表>)
+        return CallExpression(callable, self.__parse_call_arguments())
 
     @parse_trace("Function Parameters")
-    def __parse_func_params(self, it: Iterator[Token]) -> list[IdenExpression]:  # (<参数列表>)
+    def __parse_func_params(self) -> list[IdenExpression]:  # (<参数列表>)
         if self.curr_token is None or self.peek_token is None or self.curr_token.type != TokenType.LPAREN:
             raise ParserError("Function parameters must be enclosed in parentheses.")
+        next_token, parse_iden = self.__next_token, self.__iden_expr_parselet
+        RPAREN, COMMA, IDENTIFIER = TokenType.RPAREN, TokenType.COMMA, TokenType.IDENTIFIER
         parameters = []  # 参数列表
-        self.__next_token(it)
-        while self.curr_token is not None and self.curr_token.type != TokenType.RPAREN:
-            if self.curr_token.type != TokenType.IDENTIFIER:
+        append = parameters.append
+        next_token()
+        while self.curr_token is not None and self.curr_token.type is not RPAREN:
+            if self.curr_token.type is not IDENTIFIER:
                 raise ParserError("Function parameters can only be identifiers.")
-            parameters.append(self.__parse_iden_expression())
-            self.__next_token(it)  # curr_token 移动到 `,` 或 `)` 处
-            if self.curr_token is None or self.curr_token.type == TokenType.RPAREN:
+            append(parse_iden())
+            next_token()  # curr_token 移动到 `,` 或 `)` 处
+            if self.curr_token is None or self.curr_token.type is RPAREN:
                 break
-            if self.curr_token.type != TokenType.COMMA:
+            if self.curr_token.type is not COMMA:
                 raise ParserError("Function parameters must split by comma.")
-            self.__next_token(it)  # 跳过 `,`
+            next_token()  # 跳过 `,`
         if self.curr_token is None or self.curr_token.type != TokenType.RPAREN:
             raise ParserError("Function parameters must be enclosed in parentheses.")
         return parameters
 
     @parse_trace("Callable Arguments")
-    def __parse_call_arguments(self, it: Iterator[Token]) -> list[Expression]:  # (<实参列表>)
+    def __parse_call_arguments(self) -> list[Expression]:  # (<实参列表>)
         if self.curr_token is None or self.peek_token is None or self.curr_token.type != TokenType.LPAREN:
             raise ParserError("Callable arguments must be enclosed in parentheses.")
+        next_token, parse_expr = self.__next_token, self._parse_expression
+        RPAREN, COMMA, DEFAULT = TokenType.RPAREN, TokenType.COMMA, Precedence.DEFAULT
         arguments = []  # 实参列表
-        self.__next_token(it)
-        while self.curr_token is not None and self.curr_token.type != TokenType.RPAREN:
-            arguments.append(self._parse_expression(it, Precedence.DEFAULT))
-            self.__next_token(it)  # 移动到 `,` 或 `)` 处
-            if self.curr_token is None or self.curr_token.type == TokenType.RPAREN:
+        append = arguments.append
+        next_token()
+        while self.curr_token is not None and self.curr_token.type is not RPAREN:
+            append(parse_expr(DEFAULT))
+            next_token()  # 移动到 `,` 或 `)` 处
+            if self.curr_token is None or self.curr_token.type is RPAREN:
                 break
-            if self.curr_token.type != TokenType.COMMA:
+            if self.curr_token.type is not COMMA:
                 raise ParserError("Callable arguments must split by comma.")
-            self.__next_token(it)  # 跳过 `,`
+            next_token()  # 跳过 `,`
 
         if self.curr_token is None or self.curr_token.type != TokenType.RPAREN:
             raise ParserError("Callable arguments must be enclosed in parentheses.")
 
         return arguments
 
-    def __prefix_parselet(self, tok: Union[Token | TokenType]) -> Optional[Callable]:
-        token_type = tok.type if isinstance(tok, Token) else tok
-        match token_type:
-            case TokenType.IDENTIFIER:
-                return self.__iden_expr_parselet
-            case TokenType.NUMBER | TokenType.STRING | TokenType.TRUE | TokenType.FALSE:
-                return self.__literal_expr_parselet
-            case TokenType.ADD | TokenType.SUB | TokenType.NOT:  # 前缀运算符: -, +, !
-                return self.__prefix_op_expr_parselet
-
-            case TokenType.LPAREN:  # `(`
-                return self.__parse_grouped_expression
-            case TokenType.IF:
-                return self.__conditional_expr_parselet
-            case TokenType.FUNCTION:
-                return self.__parse_func_expression
-            case _:
-                return None
-
-    def __infix_parselet(self, tok: Union[Token | TokenType]) -> Optional[Callable]:
-        token_type = tok.type if isinstance(tok, Token) else tok
-        match token_type:
-            case TokenType.ADD | TokenType.SUB | TokenType.MUL | TokenType.DIV:
-                return self.__binary_op_expr_parselet
-            case TokenType.LT | TokenType.LE | TokenType.GT | TokenType.GE | TokenType.EQ | TokenType.NEQ:
-                return self.__binary_op_expr_parselet
-            case TokenType.AND | TokenType.OR:
-                return self.__binary_op_expr_parselet
-            case TokenType.ASSIGN:
-                return self.__assign_op_expr_parselet
-            case TokenType.IADD | TokenType.ISUB | TokenType.IMUL | TokenType.IDIV:
-                return self.__assign_op_expr_parselet
-            case TokenType.IAND | TokenType.IOR:
-                return self.__assign_op_expr_parselet
-
-            case TokenType.LPAREN:
-                return self.__parse_call_expression
-            case _:
-                return None
-
-    def __init_parser(self, debug: bool) -> Iterator[Token]:
+    def __init_parser(self, debug: bool) -> None:
         self.debug = debug
         self.trace = Trace()
-        it = iter(self.lexer)
-        self.curr_token = next(it, None)
-        self.peek_token = next(it, None)
-        return it
+        self._tokens: list[Optional[Token]] = list(self.lexer)
+        self._tokens.append(None)  # 哨兵: EOF 之后的 token 为 None, 移动时不需要边界检查
+        self._i = 1  # peek_token 的下标
+        self.curr_token = self._tokens[0]
+        self.peek_token = self._tokens[1]
 
-    def __next_token(self, it: Iterator[Token]):
+    def __next_token(self):  # 从缓冲的 token 列表中读取下一个 token
         self.curr_token = self.peek_token
-        self.peek_token = next(it, None)
+        if self.curr_token is not None:
+            self._i += 1
+            self.peek_token = self._tokens[self._i]
+
+    def __expect_next(self, expected: TokenType, message: str):  # 移动到下一个 token, 且其类型必须是 `expected`
+        self.__next_token()
+        if self.curr_token is None or self.curr_token.type is not expected:
+            raise ParserError(message)